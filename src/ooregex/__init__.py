@@ -92,104 +92,16 @@ Refer to the docs for a comprehensive explanation of the package's
 functionality with examples.
 """
 
-# read version from installed package
-from importlib.metadata import version
+# export names from inner module
+from .ooregex import *
+from .ooregex import __all__
 
-__version__ = version("ooregex")
 
-# export names from inner module
-from .ooregex import (
-    ANY,
-    ASCII,
-    DIGIT,
-    DOT,
-    DOTALL,
-    END,
-    IGNORECASE,
-    LOCALE,
-    MULTILINE,
-    NOT_DIGIT,
-    NOT_WHITESPACE,
-    NOT_WORD,
-    NOT_WORD_BOUNDARY,
-    START,
-    TRUE_END,
-    TRUE_START,
-    UNICODE,
-    VERBOSE,
-    WHITESPACE,
-    WORD,
-    WORD_BOUNDARY,
-    A,
-    AnyOf,
-    Comment,
-    Flag,
-    Flags,
-    Group,
-    I,
-    If,
-    L,
-    M,
-    NegativeLookAhead,
-    NegativeLookBehind,
-    NoneOf,
-    OneOrMore,
-    Optional,
-    Or,
-    PositiveLookAhead,
-    PositiveLookBehind,
-    Regex,
-    Repeat,
-    S,
-    U,
-    X,
-    ZeroOrMore,
-)
-
-__all__ = [
-    "ANY",
-    "ASCII",
-    "DIGIT",
-    "DOT",
-    "DOTALL",
-    "END",
-    "IGNORECASE",
-    "LOCALE",
-    "MULTILINE",
-    "NOT_DIGIT",
-    "NOT_WHITESPACE",
-    "NOT_WORD",
-    "NOT_WORD_BOUNDARY",
-    "START",
-    "TRUE_END",
-    "TRUE_START",
-    "UNICODE",
-    "VERBOSE",
-    "WHITESPACE",
-    "WORD",
-    "WORD_BOUNDARY",
-    "A",
-    "AnyOf",
-    "Comment",
-    "Flag",
-    "Flags",
-    "Group",
-    "I",
-    "If",
-    "L",
-    "M",
-    "NegativeLookAhead",
-    "NegativeLookBehind",
-    "NoneOf",
-    "OneOrMore",
-    "Optional",
-    "Or",
-    "PositiveLookAhead",
-    "PositiveLookBehind",
-    "Regex",
-    "Repeat",
-    "S",
-    "U",
-    "X",
-    "ZeroOrMore",
-]
+def __getattr__(name: str) -> str:
+    # read version from installed package on first access
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = globals()["__version__"] = version("ooregex")
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
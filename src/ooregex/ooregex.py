@@ -18,13 +18,168 @@ functionality with examples.
 from __future__ import annotations
 
 import re
-from typing import Iterable
+import sys
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Final, Iterable
+
+__all__ = (
+    "ANY",
+    "ASCII",
+    "DIGIT",
+    "DOT",
+    "DOTALL",
+    "END",
+    "IGNORECASE",
+    "LOCALE",
+    "MULTILINE",
+    "NOT_DIGIT",
+    "NOT_WHITESPACE",
+    "NOT_WORD",
+    "NOT_WORD_BOUNDARY",
+    "START",
+    "TRUE_END",
+    "TRUE_START",
+    "UNICODE",
+    "VERBOSE",
+    "WHITESPACE",
+    "WORD",
+    "WORD_BOUNDARY",
+    "A",
+    "AnyOf",
+    "Comment",
+    "Flag",
+    "Flags",
+    "Group",
+    "I",
+    "If",
+    "L",
+    "M",
+    "NegativeLookAhead",
+    "NegativeLookBehind",
+    "NoneOf",
+    "OneOrMore",
+    "Optional",
+    "Or",
+    "PositiveLookAhead",
+    "PositiveLookBehind",
+    "Regex",
+    "Repeat",
+    "S",
+    "U",
+    "X",
+    "ZeroOrMore",
+)
 
 # ===============================================================================
 # Utils
 # ===============================================================================
 
 
+# Expressions up to this length are interned once rendered.
+_INTERN_MAX_LENGTH = 32
+
+# Brackets that make grouping redundant when wrapping a whole expression.
+_CLOSING_BRACKETS = {"[": "]", "(": ")"}
+
+# Characters that can't be moved into a character set as they are.
+_SET_UNSAFE = frozenset(".^$|()[]{}*+?\\-#")
+
+# Inline flags in the order they're written, one bit each.
+_FLAG_ORDER = "aiLmsux"
+_FLAG_BITS = {f: 1 << i for i, f in enumerate(_FLAG_ORDER)}
+# Flags that can be disabled, i.e. "imsx".
+_DISABLE_MASK = _FLAG_BITS["i"] | _FLAG_BITS["m"] | _FLAG_BITS["s"] | _FLAG_BITS["x"]
+# Combinations of flags, shared as they're immutable.
+_FLAG_CACHE: dict[tuple[int, int], Flag] = {}
+
+
+def _as_quantifiable(expr: str | Regex) -> str:
+    """Returns an expression in a form that can be followed by a quantifier.
+
+    Parameters
+    ----------
+    expr : str | Regex
+        The expression to be quantified.
+
+    Returns
+    -------
+    str
+        `expr`, wrapped in a non-capturing group if needed.
+
+    See Also
+    --------
+    Regex._quantifiable : Implementation for Regex instances.
+    """
+    if isinstance(expr, str):
+        return f"(?:{expr})" if _needs_grouping_str(expr) else expr
+    return expr._quantifiable()
+
+
+def _as_set_member(expr: str) -> bool:
+    """Returns True if an expression means the same inside a character set.
+
+    Parameters
+    ----------
+    expr : str
+        The expression to be tested.
+
+    Returns
+    -------
+    bool
+        True for a single literal character or a class escape like \\d,
+        False otherwise.
+    """
+    if len(expr) == 1:
+        # whitespace would be ignored outside a set in verbose mode
+        return expr not in _SET_UNSAFE and not expr.isspace()
+    if len(expr) == 2 and expr[0] == "\\":
+        # escaped punctuation or a character class, but not e.g. \b
+        return expr[1] in "dDsSwW" or not expr[1].isalnum()
+    return False
+
+
+def _charset_body(values: Iterable[str | tuple[str, str]]) -> str:
+    """Returns the contents of a character set.
+
+    Parameters
+    ----------
+    values : Iterable[str | tuple[str, str]]
+        Characters to include in a set.
+        A 2-tuple represents a character range.
+
+    Returns
+    -------
+    str
+        The characters and ranges, concatenated.
+
+    Raises
+    ------
+    TypeError
+        One or more values of the wrong type.
+    """
+    try:
+        # only characters, the most common case
+        return "".join(values)  # type: ignore[arg-type]
+    except TypeError:
+        pass
+
+    parts: list[str] = []
+    for v in values:
+        if isinstance(v, str):  # a character
+            parts.append(v)
+        elif (  # a character range
+            isinstance(v, Sequence)
+            and len(v) == 2
+            and isinstance(v[0], str)
+            and isinstance(v[1], str)
+        ):
+            parts.append(f"{v[0]}-{v[1]}")
+        else:
+            raise TypeError
+    return "".join(parts)
+
+
 def _needs_grouping(expr: str | Regex) -> bool:
     """Returns True if an expression may need to be surrounded in a group.
 
@@ -40,38 +195,168 @@ def _needs_grouping(expr: str | Regex) -> bool:
     bool
         False in a few cases where grouping is redundant, True otherwise.
 
+    See Also
+    --------
+    _needs_grouping_str : Cached implementation for strings.
+    Regex._needs_group : Cached implementation for Regex instances.
+    """
+    if isinstance(expr, str):
+        return _needs_grouping_str(expr)
+    return expr._needs_group()
+
+
+@lru_cache(maxsize=4096)
+def _needs_grouping_str(s: str) -> bool:
+    """Returns True if an expression string may need to be surrounded in a group.
+
+    Implementation of `_needs_grouping`, cached since the same small
+    expressions tend to be tested many times.
+
+    Parameters
+    ----------
+    s : str
+        The expression to be tested.
+
+    Returns
+    -------
+    bool
+        False in a few cases where grouping is redundant, True otherwise.
+
     Notes
     -----
-    Go to https://regex101.com/r/lVZhG2/1 to inspect/test the pattern.
+    Grouping is redundant for a single character, an escaped character or
+    an expression entirely wrapped in `[...]` or `(...)`.
+    These are decided by looking at the characters directly, which is
+    cheaper than matching a regular expression.
+    """
+    length = len(s)
+
+    if length == 0:
+        return True
+    # a single character
+    if length == 1:
+        return False
+    # an escaped character, e.g. \d
+    if length == 2:
+        return s[0] != "\\"
+
+    close = _CLOSING_BRACKETS.get(s[0])
+    return close is None or not _is_wrapped(s, s[0], close)
 
-    Pattern matches some cases where wrapping in a group is redundant.
+
+def _is_wrapped(s: str, open_ch: str, close_ch: str) -> bool:
+    """Returns True if an expression is entirely wrapped in a pair of brackets.
+
+    Parameters
+    ----------
+    s : str
+        The expression to be tested. Must have at least 2 characters.
+    open_ch : str
+        The opening bracket.
+    close_ch : str
+        The closing bracket.
+
+    Returns
+    -------
+    bool
+        True if `s` starts with `open_ch` and it's only closed by an
+        unescaped `close_ch` at the end of `s`, False otherwise.
     """
-    pattern = r"(?P<char>^\\?.$)|(?P<square>^\[(?:[^\n\[]|\\\[)*[^\\]\]$)|(?P<braces>^\((?:[^\n\(]|\\\()*[^\\]\)$)"
+    if s[0] != open_ch or s[-1] != close_ch:
+        return False
 
-    match = re.match(pattern, str(expr))
-    # if there's a match, no need to wrap in a group
-    return match is None
+    end = len(s) - 1
+    if "\\" not in s:
+        # nothing is escaped
+        return s.find(close_ch, 1, end) == -1
 
+    i = 1
+    while (j := s.find(close_ch, i, end)) != -1:
+        if not _is_escaped(s, j):
+            return False
+        i = j + 1
+    return not _is_escaped(s, end)
 
-def _sorted_by_string(iterable: Iterable[str], order_str: str) -> list[str]:
-    """Returns a list sorted by the index of substrings in another string.
 
-    Returns a list with the elements of `iterable` sorted by the first
-    index at which they appear in `order_str`.
+def _is_escaped(s: str, index: int) -> bool:
+    """Returns True if the character at an index is escaped by a backslash.
 
     Parameters
     ----------
-    iterable : Iterable[str]
-        An iterable of strings to be sorted.
-    order_str : str
-        A string that defines the desired order of strings.
+    s : str
+        The expression containing the character.
+    index : int
+        The index of the character.
 
     Returns
     -------
-    list[str]
-        A list of strings sorted as per `order_str`.
+    bool
+        True if the character is preceded by an odd number of backslashes.
     """
-    return sorted(iterable, key=lambda c: order_str.find(c))
+    start = index
+    while start > 0 and s[start - 1] == "\\":
+        start -= 1
+    return (index - start) % 2 == 1
+
+
+@lru_cache(maxsize=512)
+def _compile_cached(s: str, flags: int) -> re.Pattern[str]:
+    """Returns the compiled pattern of an expression.
+
+    Parameters
+    ----------
+    s : str
+        The expression to be compiled.
+    flags : int
+        Flags passed to `re.compile`.
+
+    Returns
+    -------
+    re.Pattern[str]
+        The compiled pattern.
+    """
+    return re.compile(s, flags)
+
+
+def _flag_mask(flags: str) -> int:
+    """Returns the bitmask of a string of inline flags.
+
+    Parameters
+    ----------
+    flags : str
+        Any combination of the characters in "aiLmsux".
+
+    Returns
+    -------
+    int
+        The bits of all flags in `flags` set.
+
+    Raises
+    ------
+    KeyError
+        A character of `flags` isn't a flag.
+    """
+    mask = 0
+    for f in flags:
+        mask |= _FLAG_BITS[f]
+    return mask
+
+
+@lru_cache(maxsize=None)
+def _flag_string(mask: int) -> str:
+    """Returns the string of inline flags in a bitmask.
+
+    Parameters
+    ----------
+    mask : int
+        A bitmask as returned by `_flag_mask`.
+
+    Returns
+    -------
+    str
+        The flags set in `mask`, in the order of "aiLmsux".
+    """
+    return "".join([f for f in _FLAG_ORDER if mask & _FLAG_BITS[f]])
 
 
 # ===============================================================================
@@ -91,7 +376,7 @@ class Regex:
 
     Instances are immutable and hashable.
     Two instances have the same hash value if they have the same string
-    representation.
+    representation, which is computed only once per instance.
 
     Instances of this class or a subclass are also returned by operations
     on other instances.
@@ -145,12 +430,24 @@ class Regex:
     >>> str(Regex("z")[42:])
     'z{42,}'
 
+    `compile()` returns the compiled pattern, reusing it for equal expressions.
+    >>> Regex("z")[1:].compile().fullmatch("zzz")
+    <re.Match object; span=(0, 3), match='zzz'>
+
     Examples
     --------
     Refer to the docs for a comprehensive explanation of the package's
     functionality with examples.
     """
 
+    __slots__ = ("_expressions", "_str_cache", "_hash_cache", "_needs_group_cache")
+
+    _expressions: tuple[str | Regex, ...]
+    # unset until first needed
+    _str_cache: str
+    _hash_cache: int
+    _needs_group_cache: bool
+
     def __init__(self, *expressions: str | Regex) -> None:
         """
         Parameters
@@ -163,20 +460,91 @@ class Regex:
         ValueError
             No expression is passed, i.e. *expressions is empty.
         """
+        if len(expressions) == 1:
+            # nothing to concatenate, reuse the tuples
+            exp = expressions[0]
+            if type(exp) is not Regex:
+                self._expressions = expressions
+                return
+            self._expressions = exp._expressions
+            try:
+                # same expressions, same string
+                self._str_cache = exp._str_cache
+            except AttributeError:
+                pass
+            return
         if len(expressions) == 0:
             raise ValueError("No expressions passed in. Pass at least one expression.")
-        exps = []
+
+        # nothing to flatten or merge, keep the tuple as is
+        follows_str = False
         for exp in expressions:
-            # if is instance of Regex itself and not of a subclass
             if type(exp) is Regex:
-                exps.extend(exp._expressions)
-            else:
-                exps.append(exp)
+                break
+            is_str = isinstance(exp, str)
+            if is_str and follows_str:
+                break
+            follows_str = is_str
+        else:
+            self._expressions = expressions
+            return
 
-        self._expressions: tuple[str | Regex, ...] = tuple(exps)
+        exps: list[str | Regex] = []
+        for exp in expressions:
+            # if is instance of Regex itself and not of a subclass
+            parts = exp._expressions if type(exp) is Regex else (exp,)
+            for part in parts:
+                # merge adjacent strings
+                if exps and isinstance(part, str) and isinstance(last := exps[-1], str):
+                    exps[-1] = last + part
+                else:
+                    exps.append(part)
+
+        self._expressions = tuple(exps)
 
     def __str__(self) -> str:
-        return "".join(str(i) for i in self._expressions)
+        # computed on first use, instances are immutable
+        try:
+            return self._str_cache
+        except AttributeError:
+            string = self._render()
+            # short expressions are likely to be repeated, e.g. \d
+            if len(string) <= _INTERN_MAX_LENGTH:
+                string = sys.intern(string)
+            self._str_cache = string
+            return string
+
+    def _render(self) -> str:
+        """Returns the regular expression represented by this instance.
+
+        Subclasses override this instead of `__str__`, which caches the
+        result.
+        """
+        return "".join([str(i) for i in self._expressions])
+
+    def _needs_group(self) -> bool:
+        """Returns True if this expression may need to be surrounded in a group.
+
+        The result is computed on first use and cached.
+
+        See Also
+        --------
+        _needs_grouping : Test any expression.
+        """
+        try:
+            return self._needs_group_cache
+        except AttributeError:
+            self._needs_group_cache = _needs_grouping_str(str(self))
+            return self._needs_group_cache
+
+    def _quantifiable(self) -> str:
+        """Returns this expression in a form that can be followed by a quantifier.
+
+        See Also
+        --------
+        _as_quantifiable : Handle any expression.
+        """
+        return f"(?:{self!s})" if self._needs_group() else str(self)
 
     def __repr__(self) -> str:
         return " + ".join(
@@ -185,6 +553,10 @@ class Regex:
         )
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, str):
+            return str(self) == other
         return str(self) == str(other)
 
     def __or__(self, other: Regex) -> Regex:
@@ -192,59 +564,78 @@ class Regex:
             return Or(self, other)
         return NotImplemented
 
-    def __add__(self, other: Regex):
+    def __add__(self, other: Regex) -> Regex:
         if isinstance(other, Regex):
             return Regex(self, other)
         return NotImplemented
 
-    def __ge__(self, other: Regex):
+    def __ge__(self, other: Regex) -> Regex:
         if isinstance(other, Regex):
             return self + PositiveLookAhead(other)
         return NotImplemented
 
-    def __gt__(self, other: Regex):
+    def __gt__(self, other: Regex) -> Regex:
         if isinstance(other, Regex):
             return self + NegativeLookAhead(other)
         return NotImplemented
 
-    def __le__(self, other: Regex):
+    def __le__(self, other: Regex) -> Regex:
         if isinstance(other, Regex):
             return PositiveLookBehind(self) + other
         return NotImplemented
 
-    def __lt__(self, other: Regex):
+    def __lt__(self, other: Regex) -> Regex:
         if isinstance(other, Regex):
             return NegativeLookBehind(self) + other
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        try:
+            return self._hash_cache
+        except AttributeError:
+            self._hash_cache = hash(str(self))
+            return self._hash_cache
 
-    def __getitem__(self, key: int | slice):
-        match key:
-            case int():
-                if key >= 0:
-                    return Repeat(self, key)
-                raise ValueError(
-                    "Expression must match a non-negative amount of times."
-                )
+    def compile(self, flags: int = 0) -> re.Pattern[str]:
+        """Returns the compiled pattern of this expression.
 
-            case slice(start=0 | None, stop=None, step=None):
-                return ZeroOrMore(self)
+        Compiled patterns are cached, so compiling equal expressions
+        again is cheap.
 
-            case slice(start=1, stop=None, step=None):
-                return OneOrMore(self)
+        Parameters
+        ----------
+        flags : int, optional
+            Flags passed to `re.compile`, by default 0.
 
-            case slice(start=0, stop=1, step=None):
+        Returns
+        -------
+        re.Pattern[str]
+            The compiled pattern.
+        """
+        return _compile_cached(str(self), flags)
+
+    def __getitem__(self, key: int | slice) -> Regex:
+        if isinstance(key, int):
+            if key >= 0:
+                return Repeat(self, key)
+            raise ValueError("Expression must match a non-negative amount of times.")
+
+        if isinstance(key, slice) and key.step is None:
+            start, stop = key.start, key.stop
+            if stop is None:
+                if start is None or start == 0:
+                    return ZeroOrMore(self)
+                if start == 1:
+                    return OneOrMore(self)
+            elif start == 0 and stop == 1:
                 return Optional(self)
 
-            case slice(
-                start=int() | None as start_, stop=int() | None as stop_, step=None
+            if (start is None or isinstance(start, int)) and (
+                stop is None or isinstance(stop, int)
             ):
-                return Repeat(self, (start_, stop_))
+                return Repeat(self, (start, stop))
 
-            case _:
-                raise ValueError("Invalid key. Must be an int >= 0 or an int range.")
+        raise ValueError("Invalid key. Must be an int >= 0 or an int range.")
 
 
 class AnyOf(Regex):
@@ -264,7 +655,10 @@ class AnyOf(Regex):
     '[abcw-z]'
     """
 
+    __slots__ = ("_values", "_body")
+
     _values: tuple[str | tuple[str, str], ...]
+    _body: str
 
     def __init__(self, *values: str | tuple[str, str]) -> None:
         """
@@ -279,19 +673,11 @@ class AnyOf(Regex):
         TypeError
             One or more values of the wrong type.
         """
-        vals: list[str | tuple[str, str]] = []
-        for v in values:
-            match v:
-                case str():  # a character
-                    vals.append(v)
-                case [str(), str()]:  # a character range
-                    vals.append(v)
-                case _:
-                    raise TypeError
-        self._values = tuple(vals)
+        self._body = _charset_body(values)
+        self._values = values
 
-    def __str__(self) -> str:
-        return f"[{''.join((str(i) if isinstance(i, str) else f'{i[0]}-{i[1]}') for i in self._values)}]"
+    def _render(self) -> str:
+        return f"[{self._body}]"
 
     def __repr__(self) -> str:
         return f"AnyOf({', '.join(map(repr, self._values))})"
@@ -315,7 +701,10 @@ class NoneOf(Regex):
     '[^abcw-z]'
     """
 
+    __slots__ = ("_values", "_body")
+
     _values: tuple[str | tuple[str, str], ...]
+    _body: str
 
     def __init__(self, *values: str | tuple[str, str]) -> None:
         """
@@ -330,19 +719,11 @@ class NoneOf(Regex):
         TypeError
             One or more values of the wrong type.
         """
-        vals: list[str | tuple[str, str]] = []
-        for v in values:
-            match v:
-                case str():  # a character
-                    vals.append(v)
-                case [str(), str()]:  # a character range
-                    vals.append(v)
-                case _:
-                    raise TypeError
-        self._values = tuple(vals)
+        self._body = _charset_body(values)
+        self._values = values
 
-    def __str__(self) -> str:
-        return f"[^{''.join((str(i) if isinstance(i, str) else f'{i[0]}-{i[1]}') for i in self._values)}]"
+    def _render(self) -> str:
+        return f"[^{self._body}]"
 
     def __repr__(self) -> str:
         return f"NoneOf({', '.join(map(repr, self._values))})"
@@ -368,6 +749,8 @@ class Comment(Regex):
     '(?#spam)'
     """
 
+    __slots__ = ("_comment",)
+
     _comment: str | Regex
 
     def __init__(self, comment: str | Regex) -> None:
@@ -379,11 +762,11 @@ class Comment(Regex):
         """
         self._comment = comment
 
-    def __str__(self) -> str:
-        return rf"(?#{self._comment})"
+    def _render(self) -> str:
+        return f"(?#{self._comment})"
 
     def __repr__(self) -> str:
-        return rf"Comment({self._comment!r})"
+        return f"Comment({self._comment!r})"
 
 
 class Flags(Regex):
@@ -406,6 +789,8 @@ class Flags(Regex):
     '(?i:spam)'
     """
 
+    __slots__ = ("_flags", "_expression")
+
     _flags: Flag
     _expression: str | Regex | None
 
@@ -422,14 +807,14 @@ class Flags(Regex):
         self._flags = flags
         self._expression = expression
 
-    def __str__(self) -> str:
+    def _render(self) -> str:
         if self._expression is None:
-            return rf"(?{self._flags})"
+            return f"(?{self._flags!s})"
         else:
-            return rf"(?{self._flags}:{self._expression})"
+            return f"(?{self._flags!s}:{self._expression!s})"
 
     def __repr__(self) -> str:
-        return rf"Flags({self._flags!r}, {self._expression!r})"
+        return f"Flags({self._flags!r}, {self._expression!r})"
 
 
 class Group(Regex):
@@ -451,7 +836,9 @@ class Group(Regex):
     '(?P=eggs)'
     """
 
-    _expression: str | Regex | int | None = None
+    __slots__ = ("_expression", "_name", "_capture")
+
+    _expression: str | Regex | int | None
     _name: str | None
     _capture: bool
 
@@ -483,13 +870,13 @@ class Group(Regex):
         """
 
         # Check for invalid values or combinations of parameters
-        match (expression, name, capture):
+        if isinstance(name, str):
             # name + numbered group reference
-            case [int(), str(), _]:
+            if isinstance(expression, int):
                 raise ValueError(
                     "Cannot combine 'name' with a group reference by number."
                 )
-            case [str(), str() as name, _]:
+            if isinstance(expression, str):
                 if not name.isidentifier():
                     raise ValueError("Group names must be valid python identifiers.")
                 # non-capturing group is mutually exclusive with named group
@@ -497,39 +884,40 @@ class Group(Regex):
                     raise ValueError(
                         "Cannot have a named, non-capturing group. 'name' can't be used with 'capture=False'."
                     )
-            case [None, None, _]:
-                raise ValueError(
-                    f"Neither 'expression' nor 'name' were provided. At least one of them must not be None."
-                )
+        elif expression is None and name is None:
+            raise ValueError(
+                f"Neither 'expression' nor 'name' were provided. At least one of them must not be None."
+            )
 
         self._expression = expression
         self._name = name
         self._capture = capture
 
-    def __str__(self) -> str:
-        match (self._expression, self._name):
-            # Numbered group reference
-            case [int(), _]:
-                return rf"\{self._expression}"
+    def _render(self) -> str:
+        expression, name = self._expression, self._name
+        # Numbered group reference
+        if isinstance(expression, int):
+            return rf"\{expression}"
 
-            # Named group reference
-            case [None, str()]:
-                return rf"(?P={self._name})"
+        # Named group reference
+        if expression is None and isinstance(name, str):
+            return f"(?P={name})"
 
+        if isinstance(expression, (str, Regex)):
             # Named group
-            case [str() | Regex(), str()]:
-                return rf"(?P<{self._name}>{self._expression})"
+            if isinstance(name, str):
+                return f"(?P<{name}>{expression!s})"
 
             # Unnamed group
-            case [str() | Regex(), None]:
-                return ("(?:" if not self._capture else "(") + rf"{self._expression})"
+            if name is None:
+                prefix = "(" if self._capture else "(?:"
+                return f"{prefix}{expression!s})"
 
-            # Should not be reached unless members are changed after instanciation
-            case _:
-                raise ValueError("Invalid combination of parameters.")
+        # e.g. a name that isn't a str, which `__init__` doesn't check
+        raise ValueError("Invalid combination of parameters.")
 
     def __repr__(self) -> str:
-        return rf"Group({self._expression!r}, name={self._name!r}, capture={self._capture!r})"
+        return f"Group({self._expression!r}, name={self._name!r}, capture={self._capture!r})"
 
 
 class If(Regex):
@@ -550,6 +938,8 @@ class If(Regex):
     '(?(1)spam)'
     """
 
+    __slots__ = ("_group", "_then", "_else")
+
     _group: int | str
     _then: str | Regex
     _else: str | Regex | None
@@ -571,56 +961,73 @@ class If(Regex):
         self._then = then
         self._else = else_
 
-    def __str__(self) -> str:
-        return (
-            rf"(?({self._group}){self._then}"
-            + (f"|{self._else}" if self._else is not None else "")
-            + ")"
-        )
+    def _render(self) -> str:
+        if self._else is None:
+            return f"(?({self._group}){self._then!s})"
+        return f"(?({self._group}){self._then!s}|{self._else!s})"
 
     def __repr__(self) -> str:
-        return rf"If({self._group!r}, {self._then!r}, {self._else!r})"
+        return f"If({self._group!r}, {self._then!r}, {self._else!r})"
 
 
-class NegativeLookAhead(Regex):
-    """Match if the expression doesn't match next.
+class _LookAround(Regex):
+    """Base class of the lookahead and lookbehind assertions.
 
-    Match if the expression doesn't match after the current position,
-    without consuming any of the string.
-    Returned by the `>` operator.
+    Subclasses set the opening of the assertion in `_prefix`.
 
     See Also
     --------
     Regex : Base class, see other methods.
-
-    Examples
-    --------
-    >>> str(Regex("spam") > Regex("eggs"))
-    'spam(?!eggs)'
     """
 
+    __slots__ = ("_expression",)
+
     _expression: str | Regex
+    _prefix: str
 
     def __init__(self, expression: str | Regex) -> None:
         """
         Parameters
         ----------
         expression : str | Regex
-            Expression that shouldn't match.
+            Expression to test for at the current position.
         """
         self._expression = expression
 
-    def __str__(self) -> str:
-        return rf"(?!{self._expression})"
+    def _render(self) -> str:
+        return f"{self._prefix}{self._expression!s})"
+
+
+class NegativeLookAhead(_LookAround):
+    """Match if the expression doesn't match next.
+
+    Match if the expression doesn't match after the current position,
+    without consuming any of the string.
+    Returned by the `>` operator.
+
+    See Also
+    --------
+    Regex : Base class, see other methods.
+
+    Examples
+    --------
+    >>> str(Regex("spam") > Regex("eggs"))
+    'spam(?!eggs)'
+    """
+
+    __slots__ = ()
+
+    _prefix = "(?!"
 
     def __repr__(self) -> str:
-        return rf"Negative_LookAhead({self._expression!r})"
+        return f"Negative_LookAhead({self._expression!r})"
 
 
-class NegativeLookBehind(Regex):
+class NegativeLookBehind(_LookAround):
     """Match if the expression doesn't precede the current position.
 
     Match if the expression doesn't precede the current position.
+    The expression must be fixed length.
     Returned by the `<` operator.
 
     See Also
@@ -633,26 +1040,15 @@ class NegativeLookBehind(Regex):
     '(?<!spam)eggs'
     """
 
-    _expression: str | Regex
+    __slots__ = ()
 
-    def __init__(self, expression: str | Regex) -> None:
-        """
-        Parameters
-        ----------
-        expression : str | Regex
-            Expression that shouldn't precede.
-            Must be a fixed length expression.
-        """
-        self._expression = expression
-
-    def __str__(self) -> str:
-        return rf"(?<!{self._expression})"
+    _prefix = "(?<!"
 
     def __repr__(self) -> str:
-        return rf"Negative_LookBehind({self._expression!r})"
+        return f"Negative_LookBehind({self._expression!r})"
 
 
-class PositiveLookAhead(Regex):
+class PositiveLookAhead(_LookAround):
     """Match if the expression matches next.
 
     Match if the expression matches after the current position,
@@ -669,28 +1065,19 @@ class PositiveLookAhead(Regex):
     'spam(?=eggs)'
     """
 
-    _expression: str | Regex
-
-    def __init__(self, expression: str | Regex) -> None:
-        """
-        Parameters
-        ----------
-        expression : str | Regex
-            Expression that shouldn match next.
-        """
-        self._expression = expression
+    __slots__ = ()
 
-    def __str__(self) -> str:
-        return rf"(?={self._expression})"
+    _prefix = "(?="
 
     def __repr__(self) -> str:
-        return rf"Positive_LookAhead({self._expression!r})"
+        return f"Positive_LookAhead({self._expression!r})"
 
 
-class PositiveLookBehind(Regex):
+class PositiveLookBehind(_LookAround):
     """Match if the expression precedes the current position.
 
     Match if the expression precedes the current position.
+    The expression must be fixed length.
     Returned by the `<=` operator.
 
     See Also
@@ -703,23 +1090,12 @@ class PositiveLookBehind(Regex):
     '(?<=spam)eggs'
     """
 
-    _expression: str | Regex
+    __slots__ = ()
 
-    def __init__(self, expression: str | Regex) -> None:
-        """
-        Parameters
-        ----------
-        expression : str | Regex
-            Expression that shouldn precede.
-            Must be a fixed length expression.
-        """
-        self._expression = expression
-
-    def __str__(self) -> str:
-        return rf"(?<={self._expression})"
+    _prefix = "(?<="
 
     def __repr__(self) -> str:
-        return rf"Positive_LookAhead({self._expression!r})"
+        return f"Positive_LookAhead({self._expression!r})"
 
 
 class ZeroOrMore(Regex):
@@ -744,6 +1120,8 @@ class ZeroOrMore(Regex):
     '(?:spam)*?'
     """
 
+    __slots__ = ("_expression", "_greedy")
+
     _expression: str | Regex
     _greedy: bool
 
@@ -760,24 +1138,15 @@ class ZeroOrMore(Regex):
         self._expression = expression
         self._greedy = greedy
 
-    def __str__(self) -> str:
-        if _needs_grouping(self._expression):
-            ret_val = rf"(?:{self._expression})*"
-        else:
-            ret_val = rf"{self._expression}*"
-
-        if not self._greedy:
-            ret_val += "?"
-
-        return ret_val
+    def _render(self) -> str:
+        lazy = "" if self._greedy else "?"
+        return f"{_as_quantifiable(self._expression)}*{lazy}"
 
     def __repr__(self) -> str:
-        return (
-            rf"({self._expression!r})[1:]" + ".non_greedy" if not self._greedy else ""
-        )
+        return f"({self._expression!r})[1:]" + ".non_greedy" if not self._greedy else ""
 
     @property
-    def non_greedy(self):
+    def non_greedy(self) -> ZeroOrMore:
         """Return a non greedy instance.
 
         Returns a non greedy instance with the same expression, which
@@ -819,6 +1188,8 @@ class OneOrMore(Regex):
     '(?:spam)+?'
     """
 
+    __slots__ = ("_expression", "_greedy")
+
     _expression: str | Regex
     _greedy: bool
 
@@ -835,24 +1206,15 @@ class OneOrMore(Regex):
         self._expression = expression
         self._greedy = greedy
 
-    def __str__(self) -> str:
-        if _needs_grouping(self._expression):
-            ret_val = rf"(?:{self._expression})+"
-        else:
-            ret_val = rf"{self._expression}+"
-
-        if not self._greedy:
-            ret_val += "?"
-
-        return ret_val
+    def _render(self) -> str:
+        lazy = "" if self._greedy else "?"
+        return f"{_as_quantifiable(self._expression)}+{lazy}"
 
     def __repr__(self) -> str:
-        return (
-            rf"({self._expression!r})[1:]" + ".non_greedy" if not self._greedy else ""
-        )
+        return f"({self._expression!r})[1:]" + ".non_greedy" if not self._greedy else ""
 
     @property
-    def non_greedy(self):
+    def non_greedy(self) -> OneOrMore:
         """Return a non greedy instance.
 
         Returns a non greedy instance with the same expression, which
@@ -894,6 +1256,8 @@ class Optional(Regex):
     '(?:spam)??'
     """
 
+    __slots__ = ("_expression", "_greedy")
+
     _expression: str | Regex
     _greedy: bool
 
@@ -910,24 +1274,17 @@ class Optional(Regex):
         self._expression = expression
         self._greedy = greedy
 
-    def __str__(self) -> str:
-        if _needs_grouping(self._expression):
-            ret_val = rf"(?:{self._expression})?"
-        else:
-            ret_val = rf"{self._expression}?"
-
-        if not self._greedy:
-            ret_val += "?"
-
-        return ret_val
+    def _render(self) -> str:
+        lazy = "" if self._greedy else "?"
+        return f"{_as_quantifiable(self._expression)}?{lazy}"
 
     def __repr__(self) -> str:
         return (
-            rf"({self._expression!r})[0:1]" + ".non_greedy" if not self._greedy else ""
+            f"({self._expression!r})[0:1]" + ".non_greedy" if not self._greedy else ""
         )
 
     @property
-    def non_greedy(self):
+    def non_greedy(self) -> Optional:
         """Return a non greedy instance.
 
         Returns a non greedy instance with the same expression, which
@@ -970,6 +1327,8 @@ class Repeat(Regex):
     '(?:spam){42}'
     """
 
+    __slots__ = ("_expression", "_count", "_greedy")
+
     _expression: str | Regex
     _count: int | tuple[int | None, int | None]
     _greedy: bool
@@ -996,28 +1355,19 @@ class Repeat(Regex):
         self._count = count
         self._greedy = greedy
 
-    def __str__(self) -> str:
+    def _render(self) -> str:
         if isinstance(self._count, int):
-
             count = f"{{{self._count}}}"
+            # an exact amount can't be non greedy
+            lazy = ""
         else:
-            count = (
-                "{"
-                + (f"{self._count[0]}" if self._count[0] else "")
-                + ","
-                + (f"{self._count[1]}" if self._count[1] else "")
-                + "}"
-            )
-
-        if _needs_grouping(self._expression):
-            ret_val = rf"(?:{self._expression}){count}"
-        else:
-            ret_val = rf"{self._expression}{count}"
-
-        if not self._greedy and not isinstance(self._count, int):
-            ret_val += "?"
+            # omit missing bounds
+            lower = self._count[0] or ""
+            upper = self._count[1] or ""
+            count = f"{{{lower},{upper}}}"
+            lazy = "" if self._greedy else "?"
 
-        return ret_val
+        return f"{_as_quantifiable(self._expression)}{count}{lazy}"
 
     def __repr__(self) -> str:
         if isinstance(self._count, int):
@@ -1026,13 +1376,11 @@ class Repeat(Regex):
             index = f"[{self._count[0]}:{self._count[1]}]"
 
         return (
-            rf"({self._expression!r}){index}" + ".non_greedy"
-            if not self._greedy
-            else ""
+            f"({self._expression!r}){index}" + ".non_greedy" if not self._greedy else ""
         )
 
     @property
-    def non_greedy(self):
+    def non_greedy(self) -> Repeat:
         """Return a non greedy instance.
 
         Returns a non greedy instance with the same expression, which
@@ -1080,13 +1428,28 @@ class Or(Regex):
     --------
     Regex : Base class, see other methods.
 
+    Notes
+    -----
+    When quantified, alternatives that are all single characters are
+    written as a character set instead of a group.
+
+    >>> str(Or("a", "b", DIGIT)[1:])
+    '[ab\\\\d]+'
+
+    To keep the alternation as written, group it explicitly first.
+
+    >>> str(Group(Or("a", "b", DIGIT), capture=False)[1:])
+    '(?:a|b|\\\\d)+'
+
     Examples
     --------
-    >>> str(Regex("spam") | Regex("eggs")))
+    >>> str(Regex("spam") | Regex("eggs"))
     'spam|eggs'
     """
 
-    _expressions: tuple[str | Regex, ...] = tuple()
+    __slots__ = ()
+
+    _expressions: tuple[str | Regex, ...]
 
     def __init__(self, *expressions: str | Regex) -> None:
         """
@@ -1095,7 +1458,15 @@ class Or(Regex):
         *expressions : tuple[str | Regex, ...]
             Regular expression alternatives.
         """
-        exps = []
+        for exp in expressions:
+            if isinstance(exp, Or):
+                break
+        else:
+            # nothing to flatten, keep the tuple as is
+            self._expressions = expressions
+            return
+
+        exps: list[str | Regex] = []
         for exp in expressions:
             if isinstance(exp, Or):
                 exps.extend(exp._expressions)
@@ -1104,8 +1475,16 @@ class Or(Regex):
 
         self._expressions = tuple(exps)
 
-    def __str__(self) -> str:
-        return "|".join(map(str, self._expressions))
+    def _render(self) -> str:
+        return "|".join([str(e) for e in self._expressions])
+
+    def _quantifiable(self) -> str:
+        # alternatives of single characters are equivalent to a set
+        # repeated alternatives add nothing to a set
+        members = dict.fromkeys([str(e) for e in self._expressions])
+        if all(_as_set_member(m) for m in members):
+            return f"[{''.join(members)}]" if len(members) > 1 else next(iter(members))
+        return super()._quantifiable()
 
     def __repr__(self) -> str:
         return "(" + " | ".join(map(repr, self._expressions)) + ")"
@@ -1146,6 +1525,13 @@ class Flag:
     functionality with examples.
     """
 
+    __slots__ = ("_enable", "_disable", "_str_cache")
+
+    _enable: int
+    _disable: int
+    # unset until first needed
+    _str_cache: str
+
     def __init__(self, flag: str = "", disable: str = "") -> None:
         """
         Parameters
@@ -1164,44 +1550,84 @@ class Flag:
         ValueError
             Invalid value in `disable`.
         """
-        enable_flags = set(flag)
-        if any(f not in "aiLmsux" for f in enable_flags):
-            raise ValueError("Can only enable flags in 'aiLmsux'.")
+        try:
+            enable = _flag_mask(flag)
+        except KeyError:
+            raise ValueError("Can only enable flags in 'aiLmsux'.") from None
 
-        disable_flags = set(disable)
-        if any(f not in "imsx" for f in disable_flags):
-            raise ValueError("Can only disable flags in 'imsx'.")
+        try:
+            disable_mask = _flag_mask(disable)
+        except KeyError:
+            raise ValueError("Can only disable flags in 'imsx'.") from None
 
-        self._enable_flags = enable_flags
-        self._disable_flags = disable_flags
+        self._init_masks(enable, disable_mask)
+
+    @classmethod
+    def _from_masks(cls, enable: int, disable: int) -> Flag:
+        """Returns an instance with the flags in the given bitmasks.
+
+        Parameters
+        ----------
+        enable : int
+            A bitmask of the flags to enable.
+        disable : int
+            A bitmask of the flags to disable.
+
+        Raises
+        ------
+        ValueError
+            Invalid value in `disable`.
+
+        Notes
+        -----
+        Instances are cached, so combining the same flags again returns
+        the same instance.
+        """
+        key = (enable, disable)
+        try:
+            return _FLAG_CACHE[key]
+        except KeyError:
+            flag = cls.__new__(cls)
+            flag._init_masks(enable, disable)
+            _FLAG_CACHE[key] = flag
+            return flag
+
+    def _init_masks(self, enable: int, disable: int) -> None:
+        """Sets the bitmasks of the flags, see `_from_masks`."""
+        if disable & ~_DISABLE_MASK:
+            raise ValueError("Can only disable flags in 'imsx'.")
+        self._enable = enable
+        self._disable = disable
 
     def __str__(self) -> str:
-        return f"{''.join(_sorted_by_string(self._enable_flags, 'aiLmsux'))}" + (
-            f"-{''.join(_sorted_by_string(self._disable_flags, 'imsx'))}"
-            if len(self._disable_flags) > 0
-            else ""
-        )
+        try:
+            return self._str_cache
+        except AttributeError:
+            if self._disable:
+                string = f"{_flag_string(self._enable)}-{_flag_string(self._disable)}"
+            else:
+                string = _flag_string(self._enable)
+            self._str_cache = string
+            return string
 
     def __repr__(self) -> str:
-        return (
-            f"Flag({repr(''.join(_sorted_by_string(self._enable_flags, 'aiLmsux')))}"
-            + (
-                f", {repr(''.join(_sorted_by_string(self._disable_flags, 'imsx')))}"
-                if len(self._disable_flags)
-                else ""
+        if self._disable:
+            return (
+                f"Flag({_flag_string(self._enable)!r}, "
+                f"{_flag_string(self._disable)!r})"
             )
-            + ")"
-        )
+        return f"Flag({_flag_string(self._enable)!r})"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, str):
+            return str(self) == other
         return str(self) == str(other)
 
     def __or__(self, other: Flag) -> Flag:
         if isinstance(other, Flag):
-            return Flag(
-                "".join(self._enable_flags | other._enable_flags),
-                "".join(self._disable_flags),
-            )
+            return Flag._from_masks(self._enable | other._enable, self._disable)
         return NotImplemented
 
     def __add__(self, other: Flag) -> Flag:
@@ -1209,17 +1635,13 @@ class Flag:
 
     def __sub__(self, other: Flag) -> Flag:
         if isinstance(other, Flag):
-            return Flag(
-                "".join(self._enable_flags - other._enable_flags),
-                "".join(self._disable_flags | other._enable_flags),
+            return Flag._from_masks(
+                self._enable & ~other._enable, self._disable | other._enable
             )
         return NotImplemented
 
-    def __neg__(self):
-        return Flag(
-            "".join(set()),
-            "".join(self._enable_flags),
-        )
+    def __neg__(self) -> Flag:
+        return Flag._from_masks(0, self._enable)
 
 
 # ===============================================================================
@@ -1227,26 +1649,55 @@ class Flag:
 # ===============================================================================
 
 # Escape sequences
-DOT = Regex(r"\.")
-START = Regex(r"^")
-TRUE_START = Regex(r"\A")
-END = Regex(r"$")
-TRUE_END = Regex(r"\Z")
-WORD_BOUNDARY = Regex(r"\b")
-NOT_WORD_BOUNDARY = Regex(r"\B")
-DIGIT = Regex(r"\d")
-NOT_DIGIT = Regex(r"\D")
-WHITESPACE = Regex(r"\s")
-NOT_WHITESPACE = Regex(r"\S")
-WORD = Regex(r"\w")
-NOT_WORD = Regex(r"\W")
-ANY = Regex(r".")
+DOT: Final = Regex(r"\.")
+START: Final = Regex(r"^")
+TRUE_START: Final = Regex(r"\A")
+END: Final = Regex(r"$")
+TRUE_END: Final = Regex(r"\Z")
+WORD_BOUNDARY: Final = Regex(r"\b")
+NOT_WORD_BOUNDARY: Final = Regex(r"\B")
+DIGIT: Final = Regex(r"\d")
+NOT_DIGIT: Final = Regex(r"\D")
+WHITESPACE: Final = Regex(r"\s")
+NOT_WHITESPACE: Final = Regex(r"\S")
+WORD: Final = Regex(r"\w")
+NOT_WORD: Final = Regex(r"\W")
+ANY: Final = Regex(r".")
+
+# These are used everywhere, so render, hash and decide whether they need
+# grouping at import time instead of on first use.
+for _constant in (
+    DOT,
+    START,
+    TRUE_START,
+    END,
+    TRUE_END,
+    WORD_BOUNDARY,
+    NOT_WORD_BOUNDARY,
+    DIGIT,
+    NOT_DIGIT,
+    WHITESPACE,
+    NOT_WHITESPACE,
+    WORD,
+    NOT_WORD,
+    ANY,
+):
+    hash(_constant)
+    _needs_grouping(_constant)
+del _constant
 
 # Flags
-A = ASCII = Flag("a")
-I = IGNORECASE = Flag("i")
-L = LOCALE = Flag("L")
-M = MULTILINE = Flag("m")
-S = DOTALL = Flag("s")
-U = UNICODE = Flag("u")
-X = VERBOSE = Flag("x")
+A: Final = Flag("a")
+ASCII: Final = A
+I: Final = Flag("i")
+IGNORECASE: Final = I
+L: Final = Flag("L")
+LOCALE: Final = L
+M: Final = Flag("m")
+MULTILINE: Final = M
+S: Final = Flag("s")
+DOTALL: Final = S
+U: Final = Flag("u")
+UNICODE: Final = U
+X: Final = Flag("x")
+VERBOSE: Final = X
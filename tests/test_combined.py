@@ -1,47 +1,16 @@
 from ooregex import (
-    ANY,
     ASCII,
     DIGIT,
     DOT,
-    DOTALL,
-    END,
     IGNORECASE,
-    LOCALE,
-    MULTILINE,
-    NOT_DIGIT,
-    NOT_WHITESPACE,
-    NOT_WORD,
-    NOT_WORD_BOUNDARY,
-    START,
-    TRUE_END,
-    TRUE_START,
-    VERBOSE,
     WHITESPACE,
     WORD,
-    WORD_BOUNDARY,
-    A,
     AnyOf,
-    Comment,
-    Flag,
     Flags,
     Group,
-    I,
     If,
-    L,
-    M,
-    NegativeLookAhead,
-    NegativeLookBehind,
-    NoneOf,
-    OneOrMore,
-    Optional,
     Or,
-    PositiveLookAhead,
-    PositiveLookBehind,
     Regex,
-    Repeat,
-    S,
-    X,
-    ZeroOrMore,
 )
 
 # ===============================================================================
@@ -128,3 +97,13 @@ def test_complex_3():
         + Flags(IGNORECASE | ASCII, If("spam", then="spam", else_="eggs"))
     )
     assert pattern == r"(?P<spam>spam)?eggs(?=bacon)\w*(?ai:(?(spam)spam|eggs))"
+
+
+def test_quantified_or_of_chars():
+    assert Or("a", "b", DIGIT)[1:] == r"[ab\d]+"
+    assert Or("a", DIGIT, "a", r"\d")[1:] == r"[a\d]+"
+    assert Or("a", "a")[:] == r"a*"
+    assert Group(Or("a", "b"), capture=False)[1:] == r"(?:a|b)+"
+    assert Or(".", "a")[1:] == r"(?:.|a)+"
+    assert Or("a", "-", "z")[:] == r"(?:a|-|z)*"
+    assert Regex("spam") + Or("a", "b") == r"spama|b"
@@ -1,25 +1,10 @@
+import re
+
 import pytest
 from ooregex import (
-    ANY,
-    ASCII,
     DIGIT,
-    DOT,
-    DOTALL,
-    END,
     IGNORECASE,
-    LOCALE,
-    MULTILINE,
-    NOT_DIGIT,
-    NOT_WHITESPACE,
-    NOT_WORD,
-    NOT_WORD_BOUNDARY,
-    START,
-    TRUE_END,
-    TRUE_START,
     VERBOSE,
-    WHITESPACE,
-    WORD,
-    WORD_BOUNDARY,
     A,
     AnyOf,
     Comment,
@@ -28,8 +13,6 @@ from ooregex import (
     Group,
     I,
     If,
-    L,
-    M,
     NegativeLookAhead,
     NegativeLookBehind,
     NoneOf,
@@ -40,134 +23,111 @@ from ooregex import (
     PositiveLookBehind,
     Regex,
     Repeat,
-    S,
-    X,
     ZeroOrMore,
 )
 
 
-def test_base():
-    assert Regex("spam") == r"spam"
-
-
-def test_zero_plus():
-    assert ZeroOrMore("spam") == r"(?:spam)*"
-
-
-def test_one_plus():
-    assert OneOrMore("spam") == r"(?:spam)+"
-
-
-def test_optional():
-    assert Optional("spam") == r"(?:spam)?"
-
-
-def test_repeat():
-    assert Repeat("spam", count=42) == r"(?:spam){42}"
-
-
-def test_repeat_range():
-    assert Repeat("spam", count=(1, 42)) == r"(?:spam){1,42}"
-
-
-def test_repeat_non_greedy():
-    assert Repeat("spam", count=42, greedy=False) == r"(?:spam){42}"
-
-
-def test_repeat_range_non_greedy():
-    assert Repeat("spam", count=(1, 42), greedy=False) == r"(?:spam){1,42}?"
-
-
-def test_set():
-    assert AnyOf(r"spam") == r"[spam]"
-
-
-def test_set_with_range():
-    assert AnyOf((r"a", r"m")) == r"[a-m]"
-
-
-def test_set_args():
-    assert AnyOf(r"s", r"p", (r"a", r"m")) == r"[spa-m]"
-
-
-def test_not_set():
-    assert NoneOf(r"spam") == r"[^spam]"
-
-
-def test_not_set_with_range():
-    assert NoneOf((r"a", r"m")) == r"[^a-m]"
-
-
-def test_not_set_args():
-    assert NoneOf(r"s", r"p", (r"a", r"m")) == r"[^spa-m]"
-
-
-def test_or():
-    assert Or(r"spam", r"eggs") == r"spam|eggs"
-
-
-def test_group():
-    assert Group(r"spam") == r"(spam)"
-
-
-def test_group_reference():
-    assert Group(42) == r"\42"
-
-
-def test_named_group():
-    assert Group(r"spam", name="eggs") == r"(?P<eggs>spam)"
-
-
-def test_named_group_reference():
-    assert Group(name="eggs") == r"(?P=eggs)"
-
-
-def test_non_capture_group():
-    assert Group(r"spam", capture=False) == r"(?:spam)"
-
-
-def test_named_group_number_reference_exception():
-    with pytest.raises(ValueError):
-        Group(42, name="spam")
-
-
-def test_non_capture_named_exception():
-    with pytest.raises(ValueError):
-        Group(r"spam", name="spam", capture=False)
-
-
-def test_flag():
-    assert Flags(IGNORECASE) == r"(?i)"
-
-
-def test_flag_inline():
-    assert Flags(IGNORECASE, r"spam") == r"(?i:spam)"
-
-
-def test_comment():
-    assert Comment("spam") == r"(?#spam)"
-
-
-def test_positive_lookahead():
-    assert PositiveLookAhead(r"spam") == r"(?=spam)"
-
-
-def test_negative_lookahead():
-    assert NegativeLookAhead(r"spam") == r"(?!spam)"
-
-
-def test_positive_lookbehind():
-    assert PositiveLookBehind(r"spam") == r"(?<=spam)"
-
-
-def test_negative_lookbehind():
-    assert NegativeLookBehind(r"spam") == r"(?<!spam)"
+CASES = [
+    ("base", Regex, ("spam",), {}, r"spam"),
+    ("zero_plus", ZeroOrMore, ("spam",), {}, r"(?:spam)*"),
+    ("one_plus", OneOrMore, ("spam",), {}, r"(?:spam)+"),
+    ("optional", Optional, ("spam",), {}, r"(?:spam)?"),
+    ("repeat", Repeat, ("spam",), {"count": 42}, r"(?:spam){42}"),
+    ("repeat_range", Repeat, ("spam",), {"count": (1, 42)}, r"(?:spam){1,42}"),
+    (
+        "repeat_non_greedy",
+        Repeat,
+        ("spam",),
+        {"count": 42, "greedy": False},
+        r"(?:spam){42}",
+    ),
+    (
+        "repeat_range_non_greedy",
+        Repeat,
+        ("spam",),
+        {"count": (1, 42), "greedy": False},
+        r"(?:spam){1,42}?",
+    ),
+    ("set", AnyOf, (r"spam",), {}, r"[spam]"),
+    ("set_with_range", AnyOf, ((r"a", r"m"),), {}, r"[a-m]"),
+    ("set_args", AnyOf, (r"s", r"p", (r"a", r"m")), {}, r"[spa-m]"),
+    ("not_set", NoneOf, (r"spam",), {}, r"[^spam]"),
+    ("not_set_with_range", NoneOf, ((r"a", r"m"),), {}, r"[^a-m]"),
+    ("not_set_args", NoneOf, (r"s", r"p", (r"a", r"m")), {}, r"[^spa-m]"),
+    ("or", Or, (r"spam", r"eggs"), {}, r"spam|eggs"),
+    ("group", Group, (r"spam",), {}, r"(spam)"),
+    ("group_reference", Group, (42,), {}, r"\42"),
+    ("named_group", Group, (r"spam",), {"name": "eggs"}, r"(?P<eggs>spam)"),
+    ("named_group_reference", Group, (), {"name": "eggs"}, r"(?P=eggs)"),
+    ("non_capture_group", Group, (r"spam",), {"capture": False}, r"(?:spam)"),
+    ("flag", Flags, (IGNORECASE,), {}, r"(?i)"),
+    ("flag_inline", Flags, (IGNORECASE, r"spam"), {}, r"(?i:spam)"),
+    ("comment", Comment, ("spam",), {}, r"(?#spam)"),
+    ("positive_lookahead", PositiveLookAhead, (r"spam",), {}, r"(?=spam)"),
+    ("negative_lookahead", NegativeLookAhead, (r"spam",), {}, r"(?!spam)"),
+    ("positive_lookbehind", PositiveLookBehind, (r"spam",), {}, r"(?<=spam)"),
+    ("negative_lookbehind", NegativeLookBehind, (r"spam",), {}, r"(?<!spam)"),
+    (
+        "conditional",
+        If,
+        ("spam",),
+        {"then": r"eggs", "else_": r"bacon"},
+        r"(?(spam)eggs|bacon)",
+    ),
+    (
+        "conditional_number",
+        If,
+        (42,),
+        {"then": r"eggs", "else_": r"bacon"},
+        r"(?(42)eggs|bacon)",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "factory,args,kwargs,expected",
+    [case[1:] for case in CASES],
+    ids=[case[0] for case in CASES],
+)
+def test_regex_construct(factory, args, kwargs, expected):
+    assert str(factory(*args, **kwargs)) == expected
+
+
+RAISES = [
+    (
+        "named_group_number_reference",
+        Group,
+        (42,),
+        {"name": "spam"},
+        ValueError,
+    ),
+    (
+        "non_capture_named",
+        Group,
+        (r"spam",),
+        {"name": "spam", "capture": False},
+        ValueError,
+    ),
+    ("named_group_invalid_name", Group, (Regex("spam"),), {"name": 42}, ValueError),
+    ("named_group_reference_invalid_name", Group, (), {"name": 42}, ValueError),
+]
+
+
+@pytest.mark.parametrize(
+    "factory,args,kwargs,exc",
+    [case[1:] for case in RAISES],
+    ids=[case[0] for case in RAISES],
+)
+def test_regex_raises(factory, args, kwargs, exc):
+    with pytest.raises(exc):
+        str(factory(*args, **kwargs))
 
 
-def test_conditional():
-    assert If("spam", then=r"eggs", else_=r"bacon") == r"(?(spam)eggs|bacon)"
+def test_set_range_any_sequence():
+    from collections import UserList
 
-    assert If(42, then=r"eggs", else_=r"bacon") == r"(?(42)eggs|bacon)"
+    assert str(AnyOf(UserList(["a", "m"]))) == r"[a-m]"
+    assert str(NoneOf(["a", "m"])) == r"[^a-m]"
 
 
 def test_flag_join():
@@ -178,3 +138,98 @@ def test_flag_join():
 
 def test_flag_disable():
     assert A - I == r"a-i"
+
+
+def test_needs_grouping_matches_reference():
+    from ooregex.ooregex import _needs_grouping
+
+    # Pattern formerly used by _needs_grouping.
+    # Go to https://regex101.com/r/lVZhG2/1 to inspect/test the pattern.
+    reference = re.compile(
+        r"(?P<char>^\\?.$)|(?P<square>^\[(?:[^\n\[]|\\\[)*[^\\]\]$)|(?P<braces>^\((?:[^\n\(]|\\\()*[^\\]\)$)"
+    )
+
+    for expr in (
+        "",
+        "a",
+        r"\d",
+        "ab",
+        "spam",
+        "[spam]",
+        r"[\]a]",
+        r"[a\]",
+        "[a]b",
+        "(spam)",
+        r"(\)a)",
+        r"(a\)",
+        "(a)b",
+        "(?:spam|eggs)",
+    ):
+        assert _needs_grouping(expr) == (reference.match(expr) is None), expr
+
+
+def test_needs_grouping_unbalanced():
+    assert OneOrMore("[a]b]") == r"(?:[a]b])+"
+    assert OneOrMore("(a)|(b)") == r"(?:(a)|(b))+"
+    assert OneOrMore(r"[a\\]") == r"[a\\]+"
+
+
+def test_all_exported():
+    import ooregex
+
+    assert all(hasattr(ooregex, name) for name in ooregex.__all__)
+
+
+def test_str_is_cached():
+    pattern = Group(Regex("spam", DIGIT[1:]))[:]
+    assert str(pattern) is str(pattern)
+    assert pattern == r"(spam\d+)*"
+
+    concatenation = Regex("spam", DIGIT)
+    assert str(Regex(concatenation)) is str(concatenation)
+
+
+def test_no_instance_dict():
+    for instance in (
+        Regex("spam"),
+        AnyOf("spam"),
+        NoneOf("spam"),
+        Comment("spam"),
+        Flags(IGNORECASE, "spam"),
+        Group("spam"),
+        If(1, then="spam"),
+        NegativeLookAhead("spam"),
+        NegativeLookBehind("spam"),
+        PositiveLookAhead("spam"),
+        PositiveLookBehind("spam"),
+        ZeroOrMore("spam"),
+        OneOrMore("spam"),
+        Optional("spam"),
+        Repeat("spam", 42),
+        Or("spam", "eggs"),
+        IGNORECASE - VERBOSE,
+    ):
+        assert not hasattr(instance, "__dict__"), type(instance).__name__
+
+
+def test_hash_matches_str():
+    assert hash(Regex("spam", "eggs")) == hash("spameggs")
+    assert hash(Or("spam", "eggs")) == hash(Regex("spam|eggs"))
+    assert {Regex("spam"): "eggs"}["spam"] == "eggs"
+
+
+def test_adjacent_strings_merged():
+    assert repr(Regex("spam", Regex("eggs", "bacon"))) == "Regex('spameggsbacon')"
+    assert Regex("spam", DIGIT, "eggs", "bacon") == r"spam\deggsbacon"
+
+
+def test_compile():
+    pattern = Regex("spam", DIGIT[1:])
+    assert pattern.compile().fullmatch("spam42")
+    assert pattern.compile() is Regex(r"spam\d+").compile()
+    assert pattern.compile(re.IGNORECASE).fullmatch("SPAM42")
+
+
+def test_flag_combinations_shared():
+    assert (IGNORECASE | VERBOSE) is (VERBOSE + IGNORECASE)
+    assert (IGNORECASE - VERBOSE) == "i-x"